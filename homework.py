@@ -1,12 +1,13 @@
 import os
+import random
 import sys
 import time
 import logging
-from datetime import datetime, timedelta
-
 from http import HTTPStatus
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from telebot import TeleBot
 from telebot.apihelper import ApiException as TelegramApiException
@@ -18,9 +19,23 @@ TELEGRAM_TOKEN = os.getenv('TG_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TG_CHAT_ID')
 
 RETRY_PERIOD = 600
+ERROR_RETRY_PERIOD = 60
+MAX_BACKOFF = 3600
+REQUEST_TIMEOUT = (5, 30)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
+SESSION = requests.Session()
+SESSION.mount(
+    'https://', HTTPAdapter(pool_connections=2, pool_maxsize=4)
+)
+CONDITIONAL_HEADERS = {
+    'ETag': 'If-None-Match',
+    'Last-Modified': 'If-Modified-Since'
+}
+_cache_validators = {}
+_REQUIRED_RESPONSE_KEYS = ('homeworks', 'current_date')
+
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
@@ -28,14 +43,15 @@ HOMEWORK_VERDICTS = {
 }
 
 logger = logging.getLogger(__name__)
-handler = logging.StreamHandler(sys.stdout)
-formatter = logging.Formatter(
-    '%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-handler.setFormatter(formatter)
 logger.setLevel(logging.DEBUG)
-logger.addHandler(handler)
+if not logger.handlers:
+    handler = logging.StreamHandler(sys.stdout)
+    formatter = logging.Formatter(
+        '%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
 
 
 class ApiRequestError(Exception):
@@ -55,7 +71,7 @@ def check_tokens():
     if missing_tokens:
         for token in missing_tokens:
             logger.critical(
-                f'Отсутствует обязательная переменная окружения: "{token}"'
+                'Отсутствует обязательная переменная окружения: "%s"', token
             )
         return False
     return True
@@ -66,39 +82,52 @@ def send_message(bot, message):
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
     except (TelegramApiException, requests.RequestException) as error:
-        logger.error(f'Сбой при отправке сообщения: {error}')
+        logger.error('Сбой при отправке сообщения: %s', error)
         return
-    logger.debug(f'Бот отправил сообщение: "{message}"')
+    logger.debug('Бот отправил сообщение: "%s"', message)
+
+
+def reset_cache_validators():
+    """Сбрасывает сохранённые ETag и Last-Modified ответа API."""
+    _cache_validators.clear()
 
 
 def get_api_answer(timestamp):
     """Делает запрос к API Практикум.Домашка и возвращает ответ."""
     request_params = {
         'url': ENDPOINT,
-        'headers': HEADERS,
-        'params': {'from_date': timestamp}
+        'headers': {**HEADERS, **_cache_validators},
+        'params': {'from_date': timestamp},
+        'timeout': REQUEST_TIMEOUT
     }
     try:
-        response = requests.get(**request_params)
+        response = SESSION.get(**request_params)
     except requests.RequestException as error:
         raise ApiRequestError(f'Ошибка запроса к API: {error}') from error
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        logger.debug('Ответ API не изменился с прошлого запроса.')
+        return {'homeworks': [], 'current_date': timestamp}
     if response.status_code != HTTPStatus.OK:
-        raise requests.HTTPError(
+        raise ApiRequestError(
             f'Эндпоинт {ENDPOINT} недоступен. Параметры: {request_params}.'
             f'Код ответа API: {response.status_code}'
         )
-    return response.json()
+    reset_cache_validators()
+    for header, request_header in CONDITIONAL_HEADERS.items():
+        value = response.headers.get(header)
+        if value:
+            _cache_validators[request_header] = value
+    return orjson.loads(response.content)
 
 
 def check_response(response):
     """Проверяет структуру ответа."""
     logger.debug('Проверка структуры ответа.')
-    keys = ('homeworks', 'current_date')
     if not isinstance(response, dict):
         raise TypeError(
             f'Ответ не словарь, полученный тип данных: {type(response)}.'
         )
-    for key in keys:
+    for key in _REQUIRED_RESPONSE_KEYS:
         if key not in response:
             raise KeyError(f'В ответе API отсутствует ключ {key}.')
     if not isinstance(response['homeworks'], list):
@@ -109,16 +138,14 @@ def check_response(response):
 def parse_status(homework):
     """Извлекает статус домашней работы и возвращает сообщение."""
     logger.debug('Парсинг статуса домашней работы.')
-    if 'homework_name' not in homework:
+    homework_name = homework.get('homework_name')
+    if homework_name is None:
         raise KeyError('Отсутствует ключ "homework_name" в домашке.')
-    if 'status' not in homework:
-        raise KeyError('Отсутствует ключ "status" в домашке.')
-    status = homework['status']
-    if status not in HOMEWORK_VERDICTS:
+    status = homework.get('status')
+    verdict = HOMEWORK_VERDICTS.get(status)
+    if verdict is None:
         raise ValueError(f'Неопределенный статус: {status}.')
-    homework_name = homework['homework_name']
-    verdict = HOMEWORK_VERDICTS[status]
-    logger.debug(f'Распознан статус: {status}.')
+    logger.debug('Распознан статус: %s.', status)
     return f'Изменился статус проверки работы "{homework_name}". {verdict}'
 
 
@@ -132,9 +159,10 @@ def main():
 
     logger.info('Бот запущен!')
     bot = TeleBot(token=TELEGRAM_TOKEN)
-    timestamp = int((datetime.now() - timedelta(days=30)).timestamp())
-    last_status = None
+    timestamp = int(time.time()) - 30 * 86400
+    seen_statuses = {}
     last_error = None
+    consecutive_errors = 0
 
     while True:
         try:
@@ -143,35 +171,48 @@ def main():
             check_response(response)
             homeworks = response.get('homeworks', [])
 
-            if homeworks:
-                homework = homeworks[0]
-                current_status = homework.get('status')
-                if current_status != last_status:
-                    message = parse_status(homework)
-                    send_message(bot, message)
-                    last_status = current_status
-                    logger.info(
-                        f'Обнаружено изменение статуса: {current_status}.'
-                    )
-                else:
-                    logger.debug('Новых статусов нет.')
-            else:
+            if not homeworks:
                 logger.debug('Список домашних работ пуст.')
+            changed = 0
+            for homework in homeworks:
+                homework_name = homework.get('homework_name')
+                current_status = homework.get('status')
+                if (
+                    homework_name in seen_statuses
+                    and seen_statuses[homework_name] == current_status
+                ):
+                    continue
+                message = parse_status(homework)
+                send_message(bot, message)
+                seen_statuses[homework_name] = current_status
+                changed += 1
+                logger.info(
+                    'Обнаружено изменение статуса: %s.', current_status
+                )
+            if homeworks and not changed:
+                logger.debug('Новых статусов нет.')
 
             timestamp = response.get('current_date', timestamp)
-            logger.debug(f'Обновлена временная метка: {timestamp}.')
+            logger.debug('Обновлена временная метка: %s.', timestamp)
             last_error = None
+            consecutive_errors = 0
+            logger.debug('Ожидаем %s минут.', RETRY_PERIOD // 60)
+            time.sleep(RETRY_PERIOD)
 
         except Exception as error:
             error_message = f'Сбой в работе программы: {error}'
             logger.error(error_message)
+            reset_cache_validators()
             if str(error) != last_error:
                 send_message(bot, error_message)
                 last_error = str(error)
-
-        finally:
-            logger.debug(f'Ожидаем {RETRY_PERIOD // 60} минут.')
-            time.sleep(RETRY_PERIOD)
+            consecutive_errors += 1
+            backoff = min(
+                ERROR_RETRY_PERIOD * 2 ** (consecutive_errors - 1),
+                MAX_BACKOFF
+            ) * (1 + random.uniform(0, 0.5))
+            logger.debug('Повторный запрос через %.0f секунд.', backoff)
+            time.sleep(backoff)
 
 
 if __name__ == '__main__':
@@ -203,7 +203,9 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_call)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', check_request_call
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError:
@@ -211,6 +213,22 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_request_has_timeout(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        def check_request_timeout(*args, **kwargs):
+            assert kwargs.get('timeout'), (
+                'Убедитесь, что в запросе к API передан параметр `timeout`.'
+            )
+            return check_utils.MockResponseGET(
+                random_timestamp=current_timestamp
+            )
+
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', check_request_timeout
+        )
+        homework_module.get_api_answer(current_timestamp)
+
     def test_get_api_answers(
             self, monkeypatch, random_timestamp, current_timestamp,
             homework_module
@@ -228,7 +246,9 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', mock_response_get
+        )
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
@@ -246,11 +266,17 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(homework_module.SESSION, 'get', response)
         try:
             homework_module.get_api_answer(current_timestamp)
-        except Exception:
+        except homework_module.ApiRequestError:
             pass
+        except Exception as e:
+            raise AssertionError(
+                f'Убедитесь, что функция `{func_name}` выбрасывает '
+                '`ApiRequestError`, когда API домашки возвращает код, '
+                'отличный от 200.'
+            ) from e
         else:
             raise AssertionError(
                 f'Убедитесь, что в функции `{func_name}` обрабатывается '
@@ -270,7 +296,9 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', mock_request_get_with_exception
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException as e:
@@ -282,6 +310,70 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_get_not_modified_response(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        func_name = 'get_api_answer'
+        response = create_mock_response_get_with_custom_status_and_data(
+            random_timestamp=current_timestamp,
+            http_status=HTTPStatus.NOT_MODIFIED,
+            data={}
+        )
+        monkeypatch.setattr(homework_module.SESSION, 'get', response)
+        result = homework_module.get_api_answer(current_timestamp)
+        assert result == {
+            'homeworks': [],
+            'current_date': current_timestamp
+        }, (
+            f'Убедитесь, что при ответе 304 функция `{func_name}` '
+            'возвращает пустой список домашних работ.'
+        )
+
+    def test_conditional_headers_sent(
+            self, monkeypatch, current_timestamp, homework_module
+    ):
+        homework_module.reset_cache_validators()
+        response_headers = [
+            {'ETag': '"e1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+            {},
+            {}
+        ]
+        request_headers = []
+
+        def mock_response_get(*args, **kwargs):
+            request_headers.append(kwargs['headers'])
+            response = check_utils.MockResponseGET(
+                random_timestamp=current_timestamp
+            )
+            response.headers = response_headers[len(request_headers) - 1]
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        for _ in response_headers:
+            homework_module.get_api_answer(current_timestamp)
+        assert 'If-None-Match' not in request_headers[0], (
+            'Убедитесь, что первый запрос к API отправляется без '
+            'заголовка `If-None-Match`.'
+        )
+        assert request_headers[1].get('If-None-Match') == '"e1"', (
+            'Убедитесь, что сохранённый `ETag` передаётся в заголовке '
+            '`If-None-Match` следующего запроса.'
+        )
+        assert request_headers[1].get('If-Modified-Since') == (
+            'Wed, 21 Oct 2015 07:28:00 GMT'
+        ), (
+            'Убедитесь, что сохранённый `Last-Modified` передаётся в '
+            'заголовке `If-Modified-Since` следующего запроса.'
+        )
+        assert 'If-None-Match' not in request_headers[2], (
+            'Убедитесь, что валидаторы сбрасываются, если ответ API '
+            'пришёл без `ETag`.'
+        )
+        assert 'If-Modified-Since' not in request_headers[2], (
+            'Убедитесь, что валидаторы сбрасываются, если ответ API '
+            'пришёл без `Last-Modified`.'
+        )
+
     def test_parse_status_with_expected_statuses(self, homework_module):
         func_name = 'parse_status'
         check_utils.check_function(
@@ -595,7 +687,7 @@ class TestHomework:
                 data=response_data
             ))
         monkeypatch.setattr(
-            requests,
+            homework_module.SESSION,
             'get',
             mock_response_get_with_new_status
         )
@@ -658,7 +750,7 @@ class TestHomework:
                     )
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует `SESSION.get()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -751,6 +843,166 @@ class TestHomework:
                     f'Вызов функции `main` завершился ошибкой: {e}'
                 ) from e
 
+    def run_main_recording(
+            self, monkeypatch, random_message, random_timestamp,
+            current_timestamp, homework_module, mock_response_get, iterations
+    ):
+        """
+        Run main() for the given number of loop iterations and record the
+        sent messages and, for every sleep, its duration together with the
+        number of messages sent so far.
+        """
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        homework_module.reset_cache_validators()
+        monkeypatch.setattr(homework_module.SESSION, 'get', mock_response_get)
+        messages = []
+        sleeps = []
+
+        def mock_send_message(bot, message=''):
+            messages.append(message)
+
+        def record_sleep(secs):
+            sleeps.append((secs, len(messages)))
+            if len(sleeps) == iterations:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        monkeypatch.setattr(time, 'sleep', record_sleep)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        return messages, sleeps
+
+    def test_main_send_message_for_every_homework(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        response_data = {
+            'homeworks': [
+                {'homework_name': 'hw1.zip', 'status': 'approved'},
+                {'homework_name': 'hw2.zip', 'status': 'rejected'}
+            ],
+            'current_date': random_timestamp
+        }
+        messages, _ = self.run_main_recording(
+            monkeypatch, random_message, random_timestamp, current_timestamp,
+            homework_module,
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=response_data
+            ),
+            iterations=1
+        )
+        assert len(messages) == 2, (
+            'Убедитесь, что бот отправляет сообщение для каждой домашней '
+            'работы с изменившимся статусом.'
+        )
+
+    def test_main_send_message_only_on_status_change(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        first_payload = [
+            {'homework_name': 'hw1.zip', 'status': 'reviewing'},
+            {'homework_name': 'hw2.zip', 'status': 'reviewing'}
+        ]
+        changed_payload = [
+            {'homework_name': 'hw1.zip', 'status': 'reviewing'},
+            {'homework_name': 'hw2.zip', 'status': 'approved'}
+        ]
+        payloads = [first_payload, first_payload, changed_payload]
+
+        def mock_response_get(*args, **kwargs):
+            return check_utils.MockResponseGET(
+                random_timestamp=random_timestamp,
+                data={
+                    'homeworks': payloads.pop(0),
+                    'current_date': random_timestamp
+                }
+            )
+
+        messages, sleeps = self.run_main_recording(
+            monkeypatch, random_message, random_timestamp, current_timestamp,
+            homework_module, mock_response_get, iterations=3
+        )
+        assert [sent for _, sent in sleeps] == [2, 2, 3], (
+            'Убедитесь, что бот не отправляет повторное сообщение, если '
+            'статус домашней работы не изменился.'
+        )
+        assert '"hw2.zip"' in messages[-1], (
+            'Убедитесь, что при изменении статуса одной домашней работы '
+            'бот отправляет сообщение только о ней.'
+        )
+
+    def test_main_homework_without_status(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        messages, sleeps = self.run_main_recording(
+            monkeypatch, random_message, random_timestamp, current_timestamp,
+            homework_module,
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data={
+                    'homeworks': [{'homework_name': 'hw1.zip'}],
+                    'current_date': random_timestamp
+                }
+            ),
+            iterations=1
+        )
+        assert messages and messages[0].startswith('Сбой'), (
+            'Убедитесь, что бот сообщает об ошибке, если в ответе API '
+            'у домашней работы нет статуса.'
+        )
+        assert sleeps[0][0] != homework_module.RETRY_PERIOD, (
+            'Убедитесь, что домашняя работа без статуса обрабатывается '
+            'как ошибка, а не как отсутствие изменений.'
+        )
+
+    def test_main_not_modified_after_failure(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        good_homework = {'homework_name': 'good', 'status': 'approved'}
+        responses = [
+            [{'homework_name': 'bad', 'status': 'weird'}, good_homework],
+            [good_homework]
+        ]
+
+        def mock_response_get(*args, **kwargs):
+            if 'If-None-Match' in kwargs['headers']:
+                return check_utils.MockResponseGET(
+                    random_timestamp=random_timestamp,
+                    http_status=HTTPStatus.NOT_MODIFIED
+                )
+            response = check_utils.MockResponseGET(
+                random_timestamp=random_timestamp,
+                data={
+                    'homeworks': responses.pop(0),
+                    'current_date': random_timestamp
+                }
+            )
+            response.headers = {'ETag': '"e1"'}
+            return response
+
+        messages, _ = self.run_main_recording(
+            monkeypatch, random_message, random_timestamp, current_timestamp,
+            homework_module, mock_response_get, iterations=2
+        )
+        assert any('"good"' in message for message in messages), (
+            'Убедитесь, что после сбоя обработки ответа бот не использует '
+            'сохранённый `ETag` и получает изменения заново.'
+        )
+
     def test_main_log_response_whithout_homeworks(
             self, monkeypatch, random_timestamp, current_timestamp,
             random_message, caplog, homework_module
@@ -822,6 +1074,31 @@ class TestHomework:
                     'возникновении ошибки отправки сообщения в Телеграм.'
                 ) from e
 
+    def test_main_backoff_after_api_error(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            random_message, homework_module
+    ):
+        def mock_request_get_with_exception(*args, **kwargs):
+            raise requests.RequestException('Something wrong')
+
+        _, sleeps = self.run_main_recording(
+            monkeypatch, random_message, random_timestamp, current_timestamp,
+            homework_module, mock_request_get_with_exception, iterations=3
+        )
+        assert len(sleeps) == 3, (
+            'Убедитесь, что после ошибки запроса к API бот продолжает '
+            'работу и делает паузу.'
+        )
+        for errors, (delay, _) in enumerate(sleeps, start=1):
+            base = min(
+                homework_module.ERROR_RETRY_PERIOD * 2 ** (errors - 1),
+                homework_module.MAX_BACKOFF
+            )
+            assert base <= delay <= base * 1.5, (
+                'Убедитесь, что пауза после ошибки растёт экспоненциально '
+                'и ограничена `MAX_BACKOFF`.'
+            )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             check_utils.check_docstring(homework_module, func)